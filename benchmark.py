@@ -0,0 +1,66 @@
+import argparse
+import json
+import time
+import numpy as np
+import torch
+
+from src.processing.embedding_generator import EmbeddingGenerator, metadata_field_to_text
+from src.processing.embedding_pool import EmbeddingWorkerPool
+from src.config import METADATA_FILE, EMBEDDING_MODEL, EMBEDDING_DIM, EMBEDDING_BATCH_SIZE
+
+
+def load_texts(metadata_file: str, field: str) -> list:
+    """
+    Load one metadata field from every article as a list of strings.
+    """
+    with open(metadata_file, "r") as f:
+        articles = json.load(f)
+    return [metadata_field_to_text(field, a[field]) for a in articles]
+
+
+def run_single_process(generator: EmbeddingGenerator, texts: list, batch_size: int) -> np.ndarray:
+    """
+    Baseline: one in-process model with default torch threading.
+    """
+    out = np.empty((len(texts), EMBEDDING_DIM), dtype=np.float32)
+    for start in range(0, len(texts), batch_size):
+        generator.generate_embeddings(texts[start:start + batch_size], out=out[start:start + batch_size])
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark embedding throughput across worker and thread counts.")
+    parser.add_argument("--field", default="title", choices=["title", "authors", "abstract"])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=EMBEDDING_BATCH_SIZE)
+    args = parser.parse_args()
+
+    texts = load_texts(METADATA_FILE, args.field)
+    print(f"Embedding {len(texts)} '{args.field}' texts, batch size {args.batch_size}")
+
+    warmup = texts[:args.batch_size]
+
+    # Model loading and a warm-up batch are excluded from every timing.
+    generator = EmbeddingGenerator(model_name=EMBEDDING_MODEL)
+    generator.generate_embeddings(warmup)
+    start = time.perf_counter()
+    reference = run_single_process(generator, texts, args.batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"{'workers':>8} {'threads':>8} {'texts/s':>10} {'speedup':>8} {'max diff':>10}")
+    print(f"{'inproc':>8} {torch.get_num_threads():>8} {len(texts) / elapsed:>10.1f} {1.0:>8.2f} {0.0:>10.2e}")
+    baseline = elapsed
+
+    for num_workers in args.workers:
+        for num_threads in args.threads:
+            with EmbeddingWorkerPool(num_workers=num_workers, threads_per_worker=num_threads,
+                                     batch_size=args.batch_size) as pool:
+                # num_workers warm-up batches so every process is likely to pay its first-call overhead here.
+                pool.encode(warmup * num_workers)
+                pool.release()
+                start = time.perf_counter()
+                embeddings = pool.encode(texts)
+                elapsed = time.perf_counter() - start
+                max_diff = float(np.abs(embeddings - reference).max())
+                del embeddings
+            print(f"{num_workers:>8} {num_threads:>8} {len(texts) / elapsed:>10.1f} {baseline / elapsed:>8.2f} {max_diff:>10.2e}")
@@ -1,6 +1,8 @@
-from src.retrieval import PDFRetriever
-
 if __name__ == "__main__":
+    # Imported here so that spawned embedding workers, which re-import this
+    # module as __mp_main__, do not load the retriever.
+    from src.retrieval import PDFRetriever
+
     # Initialize the PDFRetriever
     retriever = PDFRetriever()
 
@@ -1,7 +1,14 @@
+import importlib
 
-from .retrieval import PDFRetriever
-from .processing import pdf_reader, embedding_generator, indexing
-from .utils import logger
+# Resolved on first access so that spawned embedding workers, which only import
+# src.processing.embedding_generator, do not load the retriever, OpenAI client or log handlers.
+_LAZY_ATTRS = {
+    "PDFRetriever": (".retrieval", "PDFRetriever"),
+    "pdf_reader": (".processing.pdf_reader", None),
+    "embedding_generator": (".processing.embedding_generator", None),
+    "indexing": (".processing.indexing", None),
+    "logger": (".utils.logger", None),
+}
 
 
 __all__ = [
@@ -11,3 +18,11 @@ __all__ = [
     "indexing",
     "logger",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _LAZY_ATTRS[name]
+    module = importlib.import_module(module_name, __name__)
+    return module if attr is None else getattr(module, attr)
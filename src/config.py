@@ -15,6 +15,11 @@ EMBEDDING_DIM = 768
 EMBEDDING_TOKEN_LENGTH = 512
 MODEL_DEVICE = "cpu" # "cuda" if torch.cuda.is_available() else "cpu"                                    
 
+# Embedding Worker Pool
+EMBEDDING_NUM_WORKERS = 1         # > 1 enables the multi-process pool during index initialization
+EMBEDDING_THREADS_PER_WORKER = 1  # torch intra-op threads per worker process
+EMBEDDING_BATCH_SIZE = 32         # texts per batch pulled from the task queue
+
 # API Key
 OPENAI_API_KEY = ""
 
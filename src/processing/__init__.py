@@ -1,5 +1,17 @@
-from .pdf_reader import PDFReader
-from .embedding_generator import EmbeddingGenerator
-from .indexing import Indexing
+import importlib
 
-__all__ = ["PDFReader", "EmbeddingGenerator", "Indexing"]
+# Resolved on first access; see src/__init__.py.
+_LAZY_ATTRS = {
+    "PDFReader": ".pdf_reader",
+    "EmbeddingGenerator": ".embedding_generator",
+    "Indexing": ".indexing",
+    "EmbeddingWorkerPool": ".embedding_pool",
+}
+
+__all__ = ["PDFReader", "EmbeddingGenerator", "Indexing", "EmbeddingWorkerPool"]
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
@@ -1,6 +1,7 @@
 import os
 from typing import List, Dict
 from transformers import AutoTokenizer, AutoModel
+import numpy as np
 import torch
 import torch.nn.functional as F
 
@@ -22,6 +23,24 @@ def mean_pooling(model_output, attention_mask):
     input_mask_expanded = attention_mask.unsqueeze(-1).expand(token_embeddings.size()).float()
     return torch.sum(token_embeddings * input_mask_expanded, 1) / torch.clamp(input_mask_expanded.sum(1), min=1e-9)
 
+def metadata_field_to_text(key: str, value) -> str:
+    """
+    Convert a metadata field to the text that is embedded. Lists (e.g. authors) are joined with spaces.
+
+    Args:
+        key (str): The metadata key, used in the error message.
+        value: The field value, either a string or a list of strings.
+
+    Returns:
+        str: The text to embed.
+    """
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, list):
+        return " ".join(value)
+    else:
+        raise ValueError(f"Unsupported metadata type for key '{key}'.")
+
 class EmbeddingGenerator:
     """
     A class to handle the generation of embeddings for document metadata using Sentence Transformers.
@@ -45,10 +64,11 @@ class EmbeddingGenerator:
             text (str): The text to generate an embedding for.
 
         Returns:
-            List[float]: The generated embedding as a list of floats.
+            List[float]: The generated embedding as a list of floats. Empty text gets a zero vector,
+            matching `generate_embeddings`.
         """
         if not text.strip():
-            return []  
+            return [0.0] * self.model.config.hidden_size
 
         inputs = self.tokenizer(text, return_tensors="pt", truncation=True, padding=True, max_length=EMBEDDING_TOKEN_LENGTH)
 
@@ -59,6 +79,36 @@ class EmbeddingGenerator:
 
         return normalized_embedding.squeeze().tolist()
 
+    def generate_embeddings(self, texts: List[str], out: np.ndarray = None) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts in a single forward pass.
+
+        Args:
+            texts (List[str]): The texts to generate embeddings for.
+            out (np.ndarray): Optional float32 array of shape (len(texts), dim) to write into.
+
+        Returns:
+            np.ndarray: A float32 array with one normalized embedding per row. Empty texts get zero vectors.
+        """
+        non_empty = [i for i, text in enumerate(texts) if text.strip()]
+        dim = self.model.config.hidden_size
+        if out is None:
+            out = np.empty((len(texts), dim), dtype=np.float32)
+        out[:] = 0.0
+        if not non_empty:
+            return out
+
+        inputs = self.tokenizer([texts[i] for i in non_empty], return_tensors="pt", truncation=True, padding=True, max_length=EMBEDDING_TOKEN_LENGTH)
+        inputs = {name: tensor.to(MODEL_DEVICE) for name, tensor in inputs.items()}
+
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            pooled_output = mean_pooling(outputs, inputs['attention_mask'])
+            normalized_embedding = F.normalize(pooled_output, p=2, dim=1)
+
+        out[non_empty] = normalized_embedding.cpu().numpy()
+        return out
+
     def generate_metadata_embedding(self, metadata: Dict[str, str]) -> Dict[str, List[float]]:
         """
         Generate embeddings for the title, author, and abstract of a document's metadata.
@@ -71,13 +121,7 @@ class EmbeddingGenerator:
         """
         embeddings = {}
         for key, value in metadata.items():
-            if isinstance(value, str):
-                embeddings[key] = self.generate_embedding(value)
-            elif isinstance(value, list):
-                value_str = " ".join(value)
-                embeddings[key] = self.generate_embedding(value_str)
-            else:
-                raise ValueError(f"Unsupported metadata type for key '{key}'.")
+            embeddings[key] = self.generate_embedding(metadata_field_to_text(key, value))
         return embeddings
 
 
@@ -0,0 +1,263 @@
+import os
+import queue
+import time
+import signal
+import traceback
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import List
+import numpy as np
+from tqdm import tqdm
+
+from src.config import (
+    EMBEDDING_MODEL, EMBEDDING_DIM, EMBEDDING_NUM_WORKERS,
+    EMBEDDING_THREADS_PER_WORKER, EMBEDDING_BATCH_SIZE
+)
+
+POLL_INTERVAL = 1.0     # Seconds between liveness checks while waiting on workers
+SHUTDOWN_TIMEOUT = 10.0 # Seconds to wait for all workers to exit before terminating them
+
+
+def _worker_loop(worker_id: int, model_name: str, num_threads: int, task_queue, result_queue, stop_event):
+    """
+    Entry point of a worker process. Loads the model once, then embeds batches from the
+    task queue and writes the vectors into the shared-memory matrix named in each task.
+
+    Args:
+        worker_id (int): Index of the worker, used in status messages.
+        model_name (str): The name of the model from Hugging Face Transformers.
+        num_threads (int): Number of torch intra-op threads for this process.
+        task_queue: Queue of (shm_name, shape, start, texts) tuples, or None to stop.
+        result_queue: Queue receiving ("ready" | "done" | "error", ...) messages.
+        stop_event: Event set by the parent to abandon any batches still queued.
+    """
+    # The parent coordinates shutdown, so Ctrl-C must not kill workers mid-write.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # The fast tokenizer otherwise batch-encodes on a Rayon pool sized to every core,
+    # which would oversubscribe the machine on top of each worker's torch threads.
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+    import torch
+    from src.processing.embedding_generator import EmbeddingGenerator
+
+    try:
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(1)
+        generator = EmbeddingGenerator(model_name=model_name)
+    except Exception:
+        result_queue.put(("error", worker_id, traceback.format_exc()))
+        return
+    result_queue.put(("ready", worker_id, None))
+
+    shm, matrix = None, None
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None or stop_event.is_set():
+                break
+            shm_name, shape, start, texts = task
+            try:
+                if shm is None or shm.name != shm_name:
+                    if shm is not None:
+                        matrix = None
+                        shm.close()
+                    shm = shared_memory.SharedMemory(name=shm_name)
+                    matrix = np.frombuffer(shm.buf, dtype=np.float32).reshape(shape)
+                generator.generate_embeddings(texts, out=matrix[start:start + len(texts)])
+                result_queue.put(("done", start, len(texts)))
+            except Exception:
+                result_queue.put(("error", start, traceback.format_exc()))
+    finally:
+        matrix = None
+        if shm is not None:
+            shm.close()
+
+
+class EmbeddingWorkerPool:
+    """
+    A pool of worker processes that each load the embedding model once and write
+    embeddings directly into a shared-memory float32 matrix.
+    """
+
+    def __init__(self, num_workers: int = EMBEDDING_NUM_WORKERS,
+                 threads_per_worker: int = EMBEDDING_THREADS_PER_WORKER,
+                 batch_size: int = EMBEDDING_BATCH_SIZE,
+                 model_name: str = EMBEDDING_MODEL,
+                 embedding_dim: int = EMBEDDING_DIM):
+        """
+        Initialize the pool configuration. Workers are started by `start()` or on entering the context.
+
+        Args:
+            num_workers (int): Number of worker processes.
+            threads_per_worker (int): Number of torch intra-op threads per worker.
+            batch_size (int): Number of texts per batch pulled from the task queue.
+            model_name (str): The name of the model from Hugging Face Transformers.
+            embedding_dim (int): Dimension of the generated embeddings.
+        """
+        if num_workers < 1 or threads_per_worker < 1 or batch_size < 1:
+            raise ValueError("num_workers, threads_per_worker and batch_size must be positive.")
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker
+        self.batch_size = batch_size
+        self.model_name = model_name
+        self.embedding_dim = embedding_dim
+
+        # torch does not survive fork() reliably, so workers are always spawned.
+        self._context = mp.get_context("spawn")
+        self._task_queue = None
+        self._result_queue = None
+        self._stop_event = None
+        self._workers = []
+        self._segments = []
+        self._unclosed_segments = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close(abort=exc_type is not None)
+
+    def start(self):
+        """
+        Start the worker processes and wait until each has loaded the model.
+        """
+        if self._workers:
+            return
+        self._task_queue = self._context.Queue()
+        self._result_queue = self._context.Queue()
+        self._stop_event = self._context.Event()
+        for worker_id in range(self.num_workers):
+            worker = self._context.Process(
+                target=_worker_loop,
+                args=(worker_id, self.model_name, self.threads_per_worker, self._task_queue, self._result_queue,
+                      self._stop_event),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        try:
+            for _ in range(self.num_workers):
+                self._wait_for("ready")
+        except BaseException:
+            self.close(abort=True)
+            raise
+
+    def encode(self, texts: List[str], desc: str = None) -> np.ndarray:
+        """
+        Embed a list of texts across the worker pool.
+
+        Row i of the result always holds the embedding of texts[i], regardless of which
+        worker processed it. The result is a view over shared memory owned by the pool:
+        it stays valid until `release()` or `close()` is called, and callers must drop
+        their references to it before then.
+
+        Args:
+            texts (List[str]): The texts to generate embeddings for.
+            desc (str): If given, show a progress bar with this description.
+
+        Returns:
+            np.ndarray: A float32 array of shape (len(texts), embedding_dim).
+        """
+        if not self._workers:
+            raise RuntimeError("EmbeddingWorkerPool is not running; call start() first.")
+        if not texts:
+            return np.empty((0, self.embedding_dim), dtype=np.float32)
+
+        shape = (len(texts), self.embedding_dim)
+        shm = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1] * np.dtype(np.float32).itemsize)
+        self._segments.append(shm)
+        # frombuffer keeps a buffer export alive for as long as any view exists, so release()
+        # cannot unmap the segment under a caller; np.ndarray(buffer=...) does not.
+        matrix = np.frombuffer(shm.buf, dtype=np.float32).reshape(shape)
+
+        num_batches = 0
+        for start in range(0, len(texts), self.batch_size):
+            self._task_queue.put((shm.name, shape, start, list(texts[start:start + self.batch_size])))
+            num_batches += 1
+
+        try:
+            with tqdm(total=len(texts), desc=desc, disable=desc is None) as progress:
+                for _ in range(num_batches):
+                    progress.update(self._wait_for("done"))
+        except BaseException:
+            # Workers may still hold batches of this request; the pool cannot be reused.
+            matrix = None
+            self.close(abort=True)
+            raise
+        return matrix
+
+    def release(self):
+        """
+        Free the shared-memory matrices returned by previous `encode()` calls.
+
+        Segments are always unlinked. A segment that a caller still holds a view of cannot be
+        unmapped yet; it is kept and closed by a later `release()` once the view is dropped.
+        """
+        for shm in self._segments:
+            shm.unlink()
+        unclosed = []
+        for shm in self._unclosed_segments + self._segments:
+            try:
+                shm.close()
+            except BufferError:
+                unclosed.append(shm)
+        self._segments = []
+        self._unclosed_segments = unclosed
+
+    def close(self, abort: bool = False):
+        """
+        Stop the workers and free shared memory.
+
+        Args:
+            abort (bool): Discard batches that have not started yet instead of finishing them.
+        """
+        if abort and self._workers:
+            # Workers check the event after each get(), so queued batches are skipped, not embedded.
+            self._stop_event.set()
+
+        for worker in self._workers:
+            if worker.is_alive():
+                self._task_queue.put(None)
+        deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        self._workers = []
+        self._stop_event = None
+
+        for q in (self._task_queue, self._result_queue):
+            if q is not None:
+                q.close()
+                q.cancel_join_thread()
+        self._task_queue = None
+        self._result_queue = None
+        self.release()
+
+    def _wait_for(self, expected: str):
+        """
+        Block until the next status message arrives, raising if a worker failed or died.
+
+        Args:
+            expected (str): The message kind expected next ("ready" or "done").
+
+        Returns:
+            int: The number of texts embedded for "done" messages, otherwise 0.
+        """
+        while True:
+            try:
+                kind, key, payload = self._result_queue.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                dead = [w for w in self._workers if not w.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Embedding worker exited unexpectedly with code {dead[0].exitcode}.")
+                continue
+            if kind == "error":
+                raise RuntimeError(f"Embedding worker failed on {key}:\n{payload}")
+            if kind != expected:
+                raise RuntimeError(f"Unexpected message from embedding worker: {kind}")
+            return payload if kind == "done" else 0
@@ -34,6 +34,25 @@ class Indexing:
         self.index_abstract.add(np.array([embeddings["abstract"]], dtype=np.float32))
         self.metadata.append(metadata)
 
+    def add_entries(self, embeddings: dict, metadata: list):
+        """
+        Add a batch of entries to the indexes in one call per index.
+
+        Float32 C-contiguous matrices (e.g. from `EmbeddingWorkerPool.encode`) are passed
+        to FAISS without an intermediate copy.
+
+        Args:
+            embeddings (dict): Dictionary with keys 'title', 'authors', 'abstract', each an (n, dim) matrix.
+            metadata (list): Metadata for each of the n entries, in row order.
+        """
+        for key in ("title", "authors", "abstract"):
+            if len(embeddings[key]) != len(metadata):
+                raise ValueError(f"Got {len(embeddings[key])} '{key}' embeddings for {len(metadata)} metadata entries.")
+        self.index_title.add(np.ascontiguousarray(embeddings["title"], dtype=np.float32))
+        self.index_author.add(np.ascontiguousarray(embeddings["authors"], dtype=np.float32))
+        self.index_abstract.add(np.ascontiguousarray(embeddings["abstract"], dtype=np.float32))
+        self.metadata.extend(metadata)
+
     def search(self, query_embeddings: dict, k: int = 5):
         """
         Search for the most similar entries for title, authors, and abstract.
@@ -1,9 +1,10 @@
 from .processing.pdf_reader import PDFReader
-from .processing.embedding_generator import EmbeddingGenerator
+from .processing.embedding_generator import EmbeddingGenerator, metadata_field_to_text
 from .processing.indexing import Indexing
+from .processing.embedding_pool import EmbeddingWorkerPool
 from .config import (
     METADATA_FILE, INDEX_TITLE_FILE, INDEX_AUTHOR_FILE, INDEX_ABSTRACT_FILE,
-    EMBEDDING_MODEL, EMBEDDING_DIM, TOP_K_RESULTS, OPENAI_API_KEY
+    EMBEDDING_MODEL, EMBEDDING_DIM, TOP_K_RESULTS, OPENAI_API_KEY, EMBEDDING_NUM_WORKERS
 )
 from tqdm import tqdm
 from .utils.logger import setup_logger
@@ -35,14 +36,17 @@ class PDFRetriever:
             with open(metadata_file, "r") as f:
                 articles = json.load(f)
 
-            for article in tqdm(articles, desc="Initializing Index"):
-                metadata = {
-                    "title": article["title"],
-                    "authors": article["authors"],
-                    "abstract": article["abstract"]
-                }
-                embeddings = self.embedding_generator.generate_metadata_embedding(metadata)
-                self.indexing.add_entry(embeddings, metadata)
+            if EMBEDDING_NUM_WORKERS > 1:
+                self._initialize_index_with_pool(articles)
+            else:
+                for article in tqdm(articles, desc="Initializing Index"):
+                    metadata = {
+                        "title": article["title"],
+                        "authors": article["authors"],
+                        "abstract": article["abstract"]
+                    }
+                    embeddings = self.embedding_generator.generate_metadata_embedding(metadata)
+                    self.indexing.add_entry(embeddings, metadata)
 
             # self.indexing.save_indexes(INDEX_TITLE_FILE, INDEX_AUTHOR_FILE, INDEX_ABSTRACT_FILE)
             # self.indexing.save_metadata(METADATA_FILE)
@@ -52,6 +56,28 @@ class PDFRetriever:
             logger.error(f"Failed to initialize index: {e}")
             raise
 
+    def _initialize_index_with_pool(self, articles: list):
+        """
+        Embed all articles with an `EmbeddingWorkerPool` and add them to the indexes in one batch.
+
+        Args:
+            articles (list): Articles containing 'title', 'authors' and 'abstract'.
+        """
+        metadata = [
+            {"title": article["title"], "authors": article["authors"], "abstract": article["abstract"]}
+            for article in articles
+        ]
+        logger.info(f"Embedding {len(metadata)} documents with {EMBEDDING_NUM_WORKERS} worker processes.")
+        with EmbeddingWorkerPool(num_workers=EMBEDDING_NUM_WORKERS, model_name=EMBEDDING_MODEL,
+                                 embedding_dim=EMBEDDING_DIM) as pool:
+            embeddings = {}
+            for key in ("title", "authors", "abstract"):
+                texts = [metadata_field_to_text(key, m[key]) for m in metadata]
+                embeddings[key] = pool.encode(texts, desc=f"Initializing Index ({key})")
+            self.indexing.add_entries(embeddings, metadata)
+            # Drop the shared-memory views before the pool frees them.
+            del embeddings
+
     def load_index(self):
         """
         Load previously saved FAISS indexes and metadata from disk.
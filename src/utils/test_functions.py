@@ -1,8 +1,11 @@
 import pytest
 import numpy as np
+import multiprocessing
+from multiprocessing import shared_memory
 from ..processing.pdf_reader import PDFReader
 from ..processing.embedding_generator import EmbeddingGenerator
 from ..processing.indexing import Indexing
+from ..processing.embedding_pool import EmbeddingWorkerPool
 from ..config import OPENAI_API_KEY
 import os
 
@@ -25,6 +28,9 @@ def test_generate_embedding():
     embedding = generator.generate_embedding(text)
     assert len(embedding) == 768, "Embedding size should match the model dimension."
 
+    empty_embedding = generator.generate_embedding("   ")
+    assert empty_embedding == [0.0] * 768, "Empty text should produce a zero vector."
+
 
 def test_generate_metadata_embedding():
     generator = EmbeddingGenerator(model_name="sentence-transformers/all-distilroberta-v1")
@@ -41,6 +47,40 @@ def test_generate_metadata_embedding():
     assert len(embeddings["authors"]) == 768, "Author embedding size should match the model dimension."
     assert len(embeddings["abstract"]) == 768, "Abstract embedding size should match the model dimension."
 
+def test_worker_pool_matches_single_process():
+    generator = EmbeddingGenerator(model_name="sentence-transformers/all-distilroberta-v1")
+    texts = ["First title.", "", "Third title about retrieval.", "Fourth title.", "Fifth title."]
+    expected = generator.generate_embeddings(texts)
+
+    with EmbeddingWorkerPool(num_workers=2, threads_per_worker=1, batch_size=2) as pool:
+        embeddings = pool.encode(texts)
+        segment_name = pool._segments[-1].name
+        assert embeddings.shape == (len(texts), 768), "Pool output should have one row per text."
+        assert embeddings.dtype == np.float32, "Pool output should be float32."
+        # Batches of different size pad differently; the measured float32 drift is below 1e-7.
+        assert np.allclose(embeddings, expected, atol=1e-5), "Rows should match single-process embeddings in input order."
+        assert not embeddings[1].any(), "Empty text should produce a zero vector."
+
+    # The view outlives close(): the segment is unlinked but stays mapped until the view is dropped.
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=segment_name)
+    assert np.allclose(embeddings, expected, atol=1e-5), "A live view should stay readable after close()."
+    assert not multiprocessing.active_children(), "close() should stop every worker process."
+    del embeddings
+    pool.release()
+    assert not pool._unclosed_segments, "release() should close segments once their views are dropped."
+
+def test_worker_pool_start_failure_leaves_no_workers():
+    pool = EmbeddingWorkerPool(num_workers=2, model_name="does-not-exist")
+    with pytest.raises(RuntimeError):
+        pool.start()
+    assert not multiprocessing.active_children(), "A failed start() should not leave worker processes behind."
+
+def test_worker_pool_encode_requires_start():
+    pool = EmbeddingWorkerPool(num_workers=1)
+    with pytest.raises(RuntimeError):
+        pool.encode(["Some title."])
+
 # Test Indexing
 def test_add_and_search():
     embedding_dim = 768
@@ -75,5 +115,30 @@ def test_add_and_search():
         assert "abstract" in result, "Abstract is missing in the result."
         assert isinstance(score, float), "Score should be a float."
 
+def test_add_entries():
+    embedding_dim = 768
+    index = Indexing(embedding_dim=embedding_dim)
+
+    embeddings = {
+        "title": np.random.rand(3, embedding_dim).astype(np.float32),
+        "authors": np.random.rand(3, embedding_dim).astype(np.float32),
+        "abstract": np.random.rand(3, embedding_dim).astype(np.float32),
+    }
+    metadata = [
+        {"title": "Doc1", "authors": "Author1", "abstract": "Abstract1"},
+        {"title": "Doc2", "authors": "Author2", "abstract": "Abstract2"},
+        {"title": "Doc3", "authors": "Author3", "abstract": "Abstract3"},
+    ]
+    index.add_entries(embeddings, metadata)
+    assert index.index_title.ntotal == 3, "All title embeddings should be indexed."
+    assert index.metadata == metadata, "Metadata should be appended in row order."
+
+    query_embeddings = {key: value[1] for key, value in embeddings.items()}
+    results = index.search(query_embeddings, k=1)
+    assert results[0][0]["title"] == "Doc2", "An exact match should rank first."
+
+    with pytest.raises(ValueError):
+        index.add_entries(embeddings, metadata[:2])
+
 if __name__ == "__main__":
     pytest.main(["-v"])